@@ -1,7 +1,22 @@
 """minion-tasks — DAG-based task flow engine."""
 
-from .dag import Stage, TaskFlow, Transition
-from .db import TaskDB
-from .loader import list_flows, load_flow
-
 __all__ = ["TaskFlow", "Stage", "Transition", "TaskDB", "load_flow", "list_flows"]
+
+# PEP 562 lazy exports — `mtask --help` shouldn't pay for sqlite3 + PyYAML.
+_EXPORT_MODULES = {
+    "Stage": "dag",
+    "TaskFlow": "dag",
+    "Transition": "dag",
+    "TaskDB": "db",
+    "load_flow": "loader",
+    "list_flows": "loader",
+}
+
+
+def __getattr__(name: str):
+    module_name = _EXPORT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(f".{module_name}", __name__), name)
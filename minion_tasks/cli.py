@@ -7,21 +7,34 @@ from __future__ import annotations
 
 import json
 import sys
+from collections.abc import Callable
 
 import click
 
 
+try:
+    import orjson
+
+    def _dumps(data) -> str:
+        # ~3-10× faster than stdlib json and handles datetimes natively
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str).decode()
+except ImportError:
+
+    def _dumps(data) -> str:
+        return json.dumps(data, indent=2, default=str)
+
+
 def _output(data, human: bool = False, compact: bool = False) -> None:
     """Route output: JSON (default), compact (agent context), or human (tables)."""
     if isinstance(data, dict) and "error" in data:
-        click.echo(json.dumps(data, indent=2, default=str), err=True)
+        click.echo(_dumps(data), err=True)
         sys.exit(1)
     if compact:
         click.echo(_format_compact(data))
     elif human:
         _print_human(data)
     else:
-        click.echo(json.dumps(data, indent=2, default=str))
+        click.echo(_dumps(data))
 
 
 def _print_human(data) -> None:
@@ -42,39 +55,54 @@ def _print_human(data) -> None:
     elif isinstance(data, dict):
         for k, v in data.items():
             if isinstance(v, (list, dict)):
-                click.echo(f"{k}: {json.dumps(v, indent=2, default=str)}")
+                click.echo(f"{k}: {_dumps(v)}")
             else:
                 click.echo(f"{k}: {v}")
     else:
         click.echo(data)
 
 
+def _fmt_task_row(row: dict) -> str:
+    assigned = row.get("assigned_to") or "—"
+    return (
+        f"{row['id']} {row['task_type']} {row['status']} "
+        f"{row.get('class_required', '—')} {assigned} — {row['description']}"
+    )
+
+
+def _fmt_project_row(row: dict) -> str:
+    return f"{row['id']} {row['status']} — {row['description']}"
+
+
+def _fmt_transition_row(row: dict) -> str:
+    agent_str = f" ({row['agent']})" if row.get("agent") else ""
+    valid_mark = "✓" if row.get("valid", 1) else "✗"
+    return f"{row['from_status']} → {row['to_status']}{agent_str} {valid_mark}"
+
+
+def _fmt_json_row(row: dict) -> str:
+    return json.dumps(row, default=str)
+
+
+def _pick_row_fmt(keys) -> Callable[[dict], str]:
+    """Dispatch on row shape once — rows in a listing are homogeneous."""
+    if "task_type" in keys:
+        return _fmt_task_row
+    if "description" in keys and "status" in keys:
+        return _fmt_project_row
+    if "from_status" in keys:
+        return _fmt_transition_row
+    return _fmt_json_row
+
+
 def _format_compact(data) -> str:
     """Format CLI output as concise text for agent context injection."""
     if isinstance(data, list):
         if not data:
             return "(none)"
         if isinstance(data[0], dict):
-            lines = []
-            for row in data:
-                # Task list compact
-                if "task_type" in row:
-                    assigned = row.get("assigned_to") or "—"
-                    lines.append(
-                        f"{row['id']} {row['task_type']} {row['status']} "
-                        f"{row.get('class_required', '—')} {assigned} — {row['description']}"
-                    )
-                # Project list compact
-                elif "description" in row and "status" in row:
-                    lines.append(f"{row['id']} {row['status']} — {row['description']}")
-                # Transition log compact
-                elif "from_status" in row:
-                    agent_str = f" ({row['agent']})" if row.get("agent") else ""
-                    valid_mark = "✓" if row.get("valid", 1) else "✗"
-                    lines.append(f"{row['from_status']} → {row['to_status']}{agent_str} {valid_mark}")
-                else:
-                    lines.append(json.dumps(row, default=str))
-            return "\n".join(lines)
+            fmt = _pick_row_fmt(data[0].keys())
+            return "\n".join(fmt(row) for row in data)
         return "\n".join(str(x) for x in data)
 
     if isinstance(data, dict):
@@ -122,26 +150,30 @@ def _format_compact(data) -> str:
 
 
 def _get_db(ctx):
-    """Lazy DB init — cached in ctx.obj. Re-reads env var each time (not module-level)."""
+    """Lazy DB init — cached in ctx.obj. Path comes from --db-path / env via Click."""
     if "db" not in ctx.obj:
-        import os
+        from minion_tasks.db import TaskDB
 
-        from minion_tasks import TaskDB
-
-        db_path = os.getenv("MINION_TASKS_DB_PATH")
-        ctx.obj["db"] = TaskDB(db_path=db_path)
+        ctx.obj["db"] = TaskDB(db_path=ctx.obj["db_path"])
     return ctx.obj["db"]
 
 
 @click.group()
 @click.option("--human", is_flag=True, help="Human-readable table output")
 @click.option("--compact", is_flag=True, help="Compact output for agent context")
+@click.option(
+    "--db-path",
+    envvar="MINION_TASKS_DB_PATH",
+    default=None,
+    help="Task DB path (default: MINION_TASKS_DB_PATH or ~/.minion-tasks/tasks.db)",
+)
 @click.pass_context
-def main(ctx, human, compact):
+def main(ctx, human, compact, db_path):
     """mtask — DAG-based task flow engine CLI."""
     ctx.ensure_object(dict)
     ctx.obj["human"] = human
     ctx.obj["compact"] = compact
+    ctx.obj["db_path"] = db_path
 
 
 # --- Project Commands ---
@@ -252,8 +284,8 @@ def claim_task(ctx, task_id, agent):
     if task["status"] != "open":
         _output({"error": f"Task '{task_id}' is '{task['status']}', not 'open'"})
         return
-    result = db.transition_task(task_id, "assigned", agent=agent)
-    _output(result, ctx.obj["human"], ctx.obj["compact"])
+    updated, _ = db.transition_task(task_id, "assigned", agent=agent)
+    _output(updated, ctx.obj["human"], ctx.obj["compact"])
 
 
 # --- Transition Commands ---
@@ -268,8 +300,14 @@ def transition(ctx, task_id, to_status, agent):
     """Manually transition a task to a new status."""
     db = _get_db(ctx)
     try:
-        result = db.transition_task(task_id, to_status, agent=agent)
-        _output(result, ctx.obj["human"], ctx.obj["compact"])
+        updated, valid = db.transition_task(task_id, to_status, agent=agent)
+        if not valid:
+            click.echo(
+                f"warning: {to_status} is not a valid transition for "
+                f"'{task_id}' — logged with valid=0",
+                err=True,
+            )
+        _output(updated, ctx.obj["human"], ctx.obj["compact"])
     except ValueError as e:
         _output({"error": str(e)})
 
@@ -297,6 +335,36 @@ def complete(ctx, task_id, agent, failed):
         _output({"error": str(e)})
 
 
+@main.command("apply-transitions")
+@click.option(
+    "--batch-json",
+    "batch_json",
+    type=click.File("r"),
+    required=True,
+    help="JSON array of {task_id, to_status, agent} objects ('-' for stdin)",
+)
+@click.pass_context
+def apply_transitions(ctx, batch_json):
+    """Apply a batch of transitions atomically — all or nothing."""
+    db = _get_db(ctx)
+    try:
+        batch = json.load(batch_json)
+        if not isinstance(batch, list) or not all(isinstance(i, dict) for i in batch):
+            _output({"error": "--batch-json must be a JSON array of objects"})
+        results = []
+        for updated, valid in db.transition_many(batch):
+            if not valid:
+                click.echo(
+                    f"warning: {updated['status']} is not a valid transition for "
+                    f"'{updated['id']}' — logged with valid=0",
+                    err=True,
+                )
+            results.append(updated)
+        _output(results, ctx.obj["human"], ctx.obj["compact"])
+    except (KeyError, ValueError) as e:
+        _output({"error": str(e)})
+
+
 @main.command("transitions")
 @click.argument("task_id")
 @click.pass_context
@@ -314,7 +382,7 @@ def transitions(ctx, task_id):
 @click.pass_context
 def list_flows_cmd(ctx):
     """List available flow types."""
-    from minion_tasks import list_flows
+    from minion_tasks.loader import list_flows
 
     result = list_flows()
     _output(result, ctx.obj["human"], ctx.obj["compact"])
@@ -325,7 +393,7 @@ def list_flows_cmd(ctx):
 @click.pass_context
 def show_flow(ctx, type_name):
     """Show a flow's stages and transitions."""
-    from minion_tasks import load_flow
+    from minion_tasks.loader import load_flow
 
     try:
         flow = load_flow(type_name)
@@ -362,7 +430,7 @@ def show_flow(ctx, type_name):
 @click.pass_context
 def next_status(ctx, type_name, current, failed):
     """Query routing: what status comes next?"""
-    from minion_tasks import load_flow
+    from minion_tasks.loader import load_flow
 
     try:
         flow = load_flow(type_name)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Stage:
     name: str
     description: str
@@ -15,30 +15,46 @@ class Stage:
     requires: list[str] = field(default_factory=list)
     terminal: bool = False
     skip: bool = False
+    # Skip-chased targets, filled in by TaskFlow.__post_init__ — stages are
+    # immutable after load, so routing becomes a plain attribute read.
+    _resolved_next: str | None = field(default=None, init=False, repr=False)
+    _resolved_fail: str | None = field(default=None, init=False, repr=False)
+    valid_targets: frozenset[str] = field(default=frozenset(), init=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskFlow:
     name: str
     description: str
     stages: dict[str, Stage]
     dead_ends: list[str] = field(default_factory=list)
 
-    def _resolve_skip(self, stage_name: str | None, seen: set[str] | None = None) -> str | None:
+    def __post_init__(self) -> None:
+        # Resolve each stage's skip chain once, so query-time routing is a
+        # single attribute read instead of a per-call walk.
+        for stage in self.stages.values():
+            stage._resolved_next = self._chase_skip(stage.next)
+            stage._resolved_fail = self._chase_skip(stage.fail)
+            if not stage.terminal:
+                targets = set(self.dead_ends)
+                if stage._resolved_next:
+                    targets.add(stage._resolved_next)
+                if stage.fail:
+                    targets.add(stage.fail)
+                stage.valid_targets = frozenset(targets)
+
+    def _chase_skip(self, stage_name: str | None) -> str | None:
         """Follow skip chain until we hit a non-skipped stage or None."""
-        if stage_name is None:
-            return None
-        if seen is None:
-            seen = set()
-        if stage_name in seen:
-            return None
-        seen.add(stage_name)
-        stage = self.stages.get(stage_name)
-        if stage is None:
-            return stage_name
-        if stage.skip:
-            return self._resolve_skip(stage.next, seen)
-        return stage_name
+        seen: set[str] = set()
+        while stage_name is not None:
+            if stage_name in seen:
+                raise ValueError(f"Flow '{self.name}': skip cycle at stage '{stage_name}'")
+            seen.add(stage_name)
+            stage = self.stages.get(stage_name)
+            if stage is None or not stage.skip:
+                return stage_name
+            stage_name = stage.next
+        return None
 
     def next_status(self, current: str, passed: bool = True) -> str | None:
         """Given current status and pass/fail, return the next status.
@@ -46,8 +62,7 @@ class TaskFlow:
         stage = self.stages.get(current)
         if stage is None or stage.terminal:
             return None
-        target = stage.next if passed else stage.fail
-        return self._resolve_skip(target)
+        return stage._resolved_next if passed else stage._resolved_fail
 
     def workers_for(self, status: str, class_required: str) -> list[str] | None:
         """Which agent classes can work on this stage for a task with given class_required.
@@ -71,18 +86,12 @@ class TaskFlow:
             return []
         return stage.requires
 
-    def valid_transitions(self, current: str) -> set[str]:
+    def valid_transitions(self, current: str) -> frozenset[str]:
         """All valid next statuses from current (including dead_ends)."""
         stage = self.stages.get(current)
         if stage is None or stage.terminal:
-            return set()
-        result = set(self.dead_ends)
-        next_resolved = self._resolve_skip(stage.next)
-        if next_resolved:
-            result.add(next_resolved)
-        if stage.fail:
-            result.add(stage.fail)
-        return result
+            return frozenset()
+        return stage.valid_targets
 
     def transition(self, current: str, class_required: str, passed: bool = True) -> Transition | None:
         """Single-call routing: next status + eligible worker classes."""
@@ -100,7 +109,7 @@ class TaskFlow:
         return stage.terminal
 
 
-@dataclass
+@dataclass(slots=True)
 class Transition:
     to_status: str
     eligible_classes: list[str] | None  # None = current assignee continues
@@ -44,54 +44,107 @@ CREATE TABLE IF NOT EXISTS transitions (
     valid       INTEGER NOT NULL DEFAULT 1,
     created_at  TEXT NOT NULL DEFAULT (datetime('now'))
 );
+
+CREATE INDEX IF NOT EXISTS idx_tasks_project_status ON tasks(project_id, status);
+CREATE INDEX IF NOT EXISTS idx_tasks_assigned ON tasks(assigned_to) WHERE assigned_to IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_tasks_class_status ON tasks(class_required, status);
+CREATE INDEX IF NOT EXISTS idx_tx_task ON transitions(task_id, created_at, id);
 """
 
+# Hoisted so every call hands sqlite3 the identical string and hits the
+# connection's prepared-statement cache.
+_SQL_INSERT_PROJECT = "INSERT INTO projects (id, description) VALUES (?, ?)"
+_SQL_GET_PROJECT = "SELECT * FROM projects WHERE id = ?"
+_SQL_LIST_PROJECTS = "SELECT * FROM projects"
+_SQL_LIST_PROJECTS_BY_STATUS = "SELECT * FROM projects WHERE status = ?"
+_SQL_INSERT_TASK = """\
+INSERT INTO tasks (id, project_id, task_type, description, file_path, class_required)
+VALUES (?, ?, ?, ?, ?, ?)"""
+_SQL_GET_TASK = "SELECT * FROM tasks WHERE id = ?"
+_SQL_UPDATE_STATUS = (
+    "UPDATE tasks SET status = ?, updated_at = datetime('now') WHERE id = ?"
+)
+_SQL_UPDATE_STATUS_ASSIGN = (
+    "UPDATE tasks SET status = ?, assigned_to = COALESCE(?, assigned_to), "
+    "updated_at = datetime('now') WHERE id = ? RETURNING *"
+)
+_SQL_INSERT_TRANSITION = (
+    "INSERT INTO transitions (task_id, from_status, to_status, agent, valid) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+_SQL_GET_TRANSITIONS = (
+    "SELECT * FROM transitions WHERE task_id = ? ORDER BY created_at, id"
+)
+
+# One SQL for every filter combination: NULL-tolerant predicates mean one
+# prepared statement instead of 16, and SQLite short-circuits the NULL tests.
+_SQL_LIST_TASKS = (
+    "SELECT * FROM tasks WHERE (?1 IS NULL OR project_id = ?1) "
+    "AND (?2 IS NULL OR status = ?2) "
+    "AND (?3 IS NULL OR class_required = ?3) "
+    "AND (?4 IS NULL OR assigned_to = ?4)"
+)
+
+
+def _dict_row(cursor: sqlite3.Cursor, row: tuple) -> dict:
+    """Row factory for the single-row get_* paths — builds the dict directly
+    instead of allocating a sqlite3.Row that is immediately converted."""
+    return {d[0]: v for d, v in zip(cursor.description, row)}
+
 
 class TaskDB:
     def __init__(self, db_path: str | None = None, flows_dir: str | Path | None = None):
         path = db_path or DB_PATH
-        if path != ":memory:":
+        is_uri = path.startswith("file:")
+        if path != ":memory:" and not is_uri:
             os.makedirs(os.path.dirname(path), exist_ok=True)
-        self._conn = sqlite3.connect(path, timeout=5)
-        self._conn.row_factory = sqlite3.Row
+        self._conn = sqlite3.connect(path, timeout=5, cached_statements=256, uri=is_uri)
+        self._conn.row_factory = _dict_row
         self._conn.execute("PRAGMA journal_mode=WAL")
         self._conn.execute("PRAGMA busy_timeout=5000")
         self._conn.execute("PRAGMA foreign_keys=ON")
+        # Write-throughput tuning for a local task DB: NORMAL is safe with WAL
+        # (no corruption on crash, at worst the last commit rolls back) and
+        # drops one fsync per commit — transitions are append-heavy.
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-8000")
+        self._conn.execute("PRAGMA mmap_size=134217728")
         self._conn.executescript(_SCHEMA_SQL)
         self._flows_dir = Path(flows_dir) if flows_dir else None
 
     # --- helpers ---
 
-    def _row_to_dict(self, row: sqlite3.Row | None) -> dict | None:
-        if row is None:
-            return None
-        return dict(row)
+    @staticmethod
+    def _fetch_dicts(cur: sqlite3.Cursor) -> list[dict]:
+        """Materialize all rows as dicts, zipping against one cached key tuple
+        instead of building a sqlite3.Row per row just to discard it."""
+        cur.row_factory = None  # fetch plain tuples
+        cols = tuple(d[0] for d in cur.description)
+        return [dict(zip(cols, row)) for row in cur.fetchall()]
 
     def _load_flow(self, task_type: str):
         return load_flow(task_type, self._flows_dir)
 
+    def close(self) -> None:
+        self._conn.close()
+
     # --- Projects ---
 
     def create_project(self, id: str, description: str) -> dict:
-        self._conn.execute(
-            "INSERT INTO projects (id, description) VALUES (?, ?)",
-            (id, description),
-        )
+        self._conn.execute(_SQL_INSERT_PROJECT, (id, description))
         self._conn.commit()
         return self.get_project(id)
 
     def get_project(self, id: str) -> dict | None:
-        row = self._conn.execute("SELECT * FROM projects WHERE id = ?", (id,)).fetchone()
-        return self._row_to_dict(row)
+        return self._conn.execute(_SQL_GET_PROJECT, (id,)).fetchone()
 
     def list_projects(self, status: str | None = None) -> list[dict]:
         if status:
-            rows = self._conn.execute(
-                "SELECT * FROM projects WHERE status = ?", (status,)
-            ).fetchall()
+            cur = self._conn.execute(_SQL_LIST_PROJECTS_BY_STATUS, (status,))
         else:
-            rows = self._conn.execute("SELECT * FROM projects").fetchall()
-        return [dict(r) for r in rows]
+            cur = self._conn.execute(_SQL_LIST_PROJECTS)
+        return self._fetch_dicts(cur)
 
     # --- Tasks ---
 
@@ -105,16 +158,14 @@ class TaskDB:
         class_required: str | None = None,
     ) -> dict:
         self._conn.execute(
-            """INSERT INTO tasks (id, project_id, task_type, description, file_path, class_required)
-               VALUES (?, ?, ?, ?, ?, ?)""",
+            _SQL_INSERT_TASK,
             (id, project_id, task_type, description, file_path, class_required),
         )
         self._conn.commit()
         return self.get_task(id)
 
     def get_task(self, id: str) -> dict | None:
-        row = self._conn.execute("SELECT * FROM tasks WHERE id = ?", (id,)).fetchone()
-        return self._row_to_dict(row)
+        return self._conn.execute(_SQL_GET_TASK, (id,)).fetchone()
 
     def list_tasks(
         self,
@@ -123,58 +174,61 @@ class TaskDB:
         class_required: str | None = None,
         assigned_to: str | None = None,
     ) -> list[dict]:
-        clauses, params = [], []
-        if project_id:
-            clauses.append("project_id = ?")
-            params.append(project_id)
-        if status:
-            clauses.append("status = ?")
-            params.append(status)
-        if class_required:
-            clauses.append("class_required = ?")
-            params.append(class_required)
-        if assigned_to:
-            clauses.append("assigned_to = ?")
-            params.append(assigned_to)
-        where = " AND ".join(clauses)
-        sql = "SELECT * FROM tasks"
-        if where:
-            sql += f" WHERE {where}"
-        return [dict(r) for r in self._conn.execute(sql, params).fetchall()]
+        params = (
+            project_id or None,
+            status or None,
+            class_required or None,
+            assigned_to or None,
+        )
+        return self._fetch_dicts(self._conn.execute(_SQL_LIST_TASKS, params))
 
     # --- Transitions ---
 
-    def transition_task(self, task_id: str, to_status: str, agent: str | None = None) -> dict:
-        """Move task to a new status. Validates against DAG, logs with valid flag."""
+    def _transition(
+        self, task_id: str, to_status: str, agent: str | None
+    ) -> tuple[dict, bool]:
+        """UPDATE + audit INSERT for one transition. Caller owns the transaction."""
         task = self.get_task(task_id)
         if task is None:
             raise ValueError(f"Task '{task_id}' not found")
 
         from_status = task["status"]
         flow = self._load_flow(task["task_type"])
-        valid_targets = flow.valid_transitions(from_status)
-        is_valid = to_status in valid_targets
-
-        if not is_valid:
-            import warnings
-            warnings.warn(
-                f"Transition {from_status} → {to_status} not valid for flow '{task['task_type']}'. "
-                f"Valid: {valid_targets}. Logging with valid=0.",
-                stacklevel=2,
-            )
+        is_valid = to_status in flow.valid_transitions(from_status)
 
+        # RETURNING gives us the updated row without a second SELECT.
+        updated = self._conn.execute(
+            _SQL_UPDATE_STATUS_ASSIGN, (to_status, agent, task_id)
+        ).fetchone()
         self._conn.execute(
-            "UPDATE tasks SET status = ?, assigned_to = COALESCE(?, assigned_to), "
-            "updated_at = datetime('now') WHERE id = ?",
-            (to_status, agent, task_id),
-        )
-        self._conn.execute(
-            "INSERT INTO transitions (task_id, from_status, to_status, agent, valid) "
-            "VALUES (?, ?, ?, ?, ?)",
+            _SQL_INSERT_TRANSITION,
             (task_id, from_status, to_status, agent, 1 if is_valid else 0),
         )
-        self._conn.commit()
-        return self.get_task(task_id)
+        return updated, is_valid
+
+    def transition_task(
+        self, task_id: str, to_status: str, agent: str | None = None
+    ) -> tuple[dict, bool]:
+        """Move task to a new status. Validates against DAG, logs with valid flag.
+
+        Returns (updated_task, valid). Invalid transitions still apply — the
+        system warns but doesn't block — with valid=False so callers can
+        surface it however they like (the CLI prints to stderr)."""
+        # Single transaction: one fsync for the UPDATE + audit INSERT.
+        with self._conn:
+            return self._transition(task_id, to_status, agent)
+
+    def transition_many(self, items: list[dict]) -> list[tuple[dict, bool]]:
+        """Apply a batch of {task_id, to_status, agent?} transitions atomically.
+
+        One transaction and one fsync for the whole batch; an error mid-batch
+        (unknown task) rolls everything back, so callers never see a
+        partially applied batch."""
+        with self._conn:
+            return [
+                self._transition(item["task_id"], item["to_status"], item.get("agent"))
+                for item in items
+            ]
 
     def complete(self, task_id: str, agent: str, passed: bool = True) -> Transition | None:
         """Assignee says 'done' — DAG routes to next stage, DB updated."""
@@ -187,22 +241,14 @@ class TaskDB:
         if result is None:
             return None
 
-        # Update DB
-        self._conn.execute(
-            "UPDATE tasks SET status = ?, updated_at = datetime('now') WHERE id = ?",
-            (result.to_status, task_id),
-        )
-        self._conn.execute(
-            "INSERT INTO transitions (task_id, from_status, to_status, agent, valid) "
-            "VALUES (?, ?, ?, ?, 1)",
-            (task_id, task["status"], result.to_status, agent),
-        )
-        self._conn.commit()
+        # Update DB — one transaction, one fsync
+        with self._conn:
+            self._conn.execute(_SQL_UPDATE_STATUS, (result.to_status, task_id))
+            self._conn.execute(
+                _SQL_INSERT_TRANSITION,
+                (task_id, task["status"], result.to_status, agent, 1),
+            )
         return result
 
     def get_transitions(self, task_id: str) -> list[dict]:
-        rows = self._conn.execute(
-            "SELECT * FROM transitions WHERE task_id = ? ORDER BY created_at, id",
-            (task_id,),
-        ).fetchall()
-        return [dict(r) for r in rows]
+        return self._fetch_dicts(self._conn.execute(_SQL_GET_TRANSITIONS, (task_id,)))
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
-import yaml
-
 from ._schema import REQUIRED_TOP_KEYS
 from .dag import Stage, TaskFlow
 
-# Search order: env var, ~/.minion-tasks/task-flows/, bundled with package
+# Search order: env var, ~/.minion-tasks/task-flows/, bundled with package.
+# Cached on first use rather than computed at import — importing the package
+# shouldn't stat the filesystem.
+@functools.lru_cache(maxsize=1)
 def _find_flows_dir() -> Path:
     import os
     import sysconfig
@@ -17,36 +19,60 @@ def _find_flows_dir() -> Path:
     env = os.getenv("MINION_TASKS_FLOWS_DIR")
     if env:
         return Path(env)
-    user_dir = Path.home() / ".minion-tasks" / "task-flows"
-    if user_dir.exists():
-        return user_dir
-    shared = Path(sysconfig.get_path("data")) / "share" / "minion-tasks" / "task-flows"
-    if shared.exists():
-        return shared
+    candidates = (
+        Path.home() / ".minion-tasks" / "task-flows",
+        Path(sysconfig.get_path("data")) / "share" / "minion-tasks" / "task-flows",
+    )
+    for candidate in candidates:
+        try:
+            os.stat(candidate)
+        except OSError:
+            continue
+        return candidate
     return Path(__file__).resolve().parent.parent / "task-flows"
 
 
-_DEFAULT_FLOWS_DIR = _find_flows_dir()
+def _load_yaml(path: Path) -> dict:
+    return _load_yaml_cached(str(path), path.stat().st_mtime_ns)
 
 
-def _load_yaml(path: Path) -> dict:
-    with open(path) as f:
-        return yaml.safe_load(f)
+@functools.lru_cache(maxsize=64)
+def _load_yaml_cached(path: str, mtime_ns: int) -> dict:
+    # PyYAML imported here, not at module scope, so CLI invocations that never
+    # touch a flow don't pay for it.
+    import yaml
+
+    try:
+        # libyaml-backed C scanner — ~10-20× faster than the pure-Python SafeLoader
+        from yaml import CSafeLoader as loader_cls
+    except ImportError:
+        from yaml import SafeLoader as loader_cls
+
+    # Bytes in, so the C scanner handles decoding without a Python-level pass.
+    # Cached per (path, mtime) — callers must not mutate the returned dict.
+    with open(path, "rb") as f:
+        return yaml.load(f.read(), Loader=loader_cls)
 
 
 def _merge_stages(base_stages: dict, override_stages: dict | None) -> dict:
-    """Deep-merge override stages into base. Override keys replace base keys per-stage."""
+    """Deep-merge override stages into base. Override keys replace base keys per-stage.
+
+    Stage configs that aren't overridden are shared, not copied — nothing
+    downstream mutates them (_build_stage only reads), and a copy per
+    inheritance level added up for deep chains."""
     if not override_stages:
         return dict(base_stages)
     merged = {}
     for name, base_cfg in base_stages.items():
         if name in override_stages:
-            merged[name] = {**base_cfg, **override_stages[name]}
+            m = base_cfg.copy()  # C-level PyDict_Copy, cheaper than ** unpacking
+            m.update(override_stages[name])
+            merged[name] = m
         else:
-            merged[name] = dict(base_cfg)
+            merged[name] = base_cfg
     for name, cfg in override_stages.items():
         if name not in merged:
-            merged[name] = dict(cfg)
+            merged[name] = cfg
     return merged
 
 
@@ -68,25 +94,21 @@ def _resolve_inheritance(raw: dict, flows_dir: Path) -> dict:
 
 
 def _validate(raw: dict, name: str) -> None:
-    """Basic validation — required keys, non-terminal stages need next."""
-    missing = REQUIRED_TOP_KEYS - set(raw.keys())
+    """Top-level validation — required keys, at least one stage.
+
+    Per-stage checks live in _build_stage so flows get one pass, not two."""
+    missing = REQUIRED_TOP_KEYS.difference(raw)
     if missing:
         raise ValueError(f"Flow '{name}' missing required keys: {missing}")
-    stages = raw.get("stages", {})
-    if not stages:
+    if not raw.get("stages"):
         raise ValueError(f"Flow '{name}' has no stages")
-    for stage_name, cfg in stages.items():
-        if cfg.get("skip"):
-            continue
-        if cfg.get("terminal"):
-            continue
-        if "next" not in cfg:
-            raise ValueError(
-                f"Flow '{name}', stage '{stage_name}': non-terminal stage must have 'next'"
-            )
 
 
-def _build_stage(name: str, cfg: dict) -> Stage:
+def _build_stage(flow_name: str, name: str, cfg: dict) -> Stage:
+    if "next" not in cfg and not cfg.get("terminal") and not cfg.get("skip"):
+        raise ValueError(
+            f"Flow '{flow_name}', stage '{name}': non-terminal stage must have 'next'"
+        )
     return Stage(
         name=name,
         description=cfg.get("description", ""),
@@ -99,32 +121,124 @@ def _build_stage(name: str, cfg: dict) -> Stage:
     )
 
 
+@functools.lru_cache(maxsize=8)
+def _index_flows(flows_path: str, mtime_ns: int) -> dict[str, Path]:
+    """Map task type name -> flow file, refreshed when the directory changes."""
+    index = {}
+    for p in sorted(Path(flows_path).glob("*.yaml")):
+        name = p.stem
+        if name.startswith("_"):
+            name = name[1:]
+        index[name] = p
+    return index
+
+
 def load_flow(task_type: str, flows_dir: str | Path | None = None) -> TaskFlow:
-    """Load a task flow DAG by type name. Resolves inheritance from _base.yaml."""
-    flows_path = Path(flows_dir) if flows_dir else _DEFAULT_FLOWS_DIR
-    filename = f"_{task_type}.yaml" if task_type == "base" else f"{task_type}.yaml"
-    flow_path = flows_path / filename
-    if not flow_path.exists():
-        raise FileNotFoundError(f"Task flow '{task_type}' not found at {flow_path}")
-    raw = _load_yaml(flow_path)
-    raw = _resolve_inheritance(raw, flows_path)
+    """Load a task flow DAG by type name. Resolves inheritance from _base.yaml.
+
+    Results are cached per (path, newest YAML mtime in the dir) — flow files
+    rarely change, so repeat loads in the same process (DB transitions, test
+    suites) skip the parse, while an edit anywhere in an inheritance chain
+    invalidates the flows built from it.
+    """
+    flows_path = Path(flows_dir) if flows_dir else _find_flows_dir()
+    try:
+        index = _index_flows(str(flows_path), flows_path.stat().st_mtime_ns)
+        flow_path = index[task_type]
+    except (OSError, KeyError):
+        # Missing dir and unknown type read the same to callers: no such flow.
+        raise FileNotFoundError(
+            f"Task flow '{task_type}' not found in {flows_path}"
+        ) from None
+    # Cache key is the newest mtime across *all* YAMLs in the dir, not just
+    # this flow's: editing a parent (_base.yaml) must invalidate every flow
+    # that inherits from it, and statting a handful of files is cheaper than
+    # parsing the child to discover its chain.
+    newest_yaml_ns = max(p.stat().st_mtime_ns for p in index.values())
+    return _load_flow_cached(task_type, str(flow_path), newest_yaml_ns, str(flows_path))
+
+
+@functools.lru_cache(maxsize=64)
+def _load_flow_cached(task_type: str, flow_path: str, newest_yaml_ns: int, flows_path: str) -> TaskFlow:
+    flow = _read_flow_pickle(flow_path, newest_yaml_ns)
+    if flow is not None:
+        return flow
+    raw = _load_yaml(Path(flow_path))
+    raw = _resolve_inheritance(raw, Path(flows_path))
     _validate(raw, task_type)
-    stages = {name: _build_stage(name, cfg) for name, cfg in raw["stages"].items()}
-    return TaskFlow(
+    stages = {name: _build_stage(task_type, name, cfg) for name, cfg in raw["stages"].items()}
+    flow = TaskFlow(
         name=raw["name"],
         description=raw.get("description", ""),
         stages=stages,
         dead_ends=raw.get("dead_ends", []),
     )
+    _write_flow_pickle(flow_path, flow)
+    return flow
+
+
+# Bump whenever the dag.py dataclass layout changes. Sidecars carry fully
+# built objects, so one written by an older package would unpickle fine and
+# only blow up later at query time (slots=True drops missing attributes
+# silently) — a version mismatch has to read as a plain cache miss.
+_CACHE_VERSION = 1
+
+
+def _read_flow_pickle(flow_path: str, newest_yaml_ns: int) -> TaskFlow | None:
+    """Cross-process parse cache: a pickled TaskFlow sidecar next to the YAML.
+
+    Unpickling a built flow is far cheaper than parse + inherit + validate.
+    The sidecar is stale if any YAML in the flows dir is newer — a flow bakes
+    in resolved stages from its parents, so a parent edit invalidates it too —
+    or if it was written under a different _CACHE_VERSION.
+    Best-effort — any stale, missing, or unreadable sidecar means reparse."""
+    import pickle
+
+    pkl = Path(flow_path).with_suffix(".flow.pkl")
+    try:
+        if pkl.stat().st_mtime_ns < newest_yaml_ns:
+            return None
+        with open(pkl, "rb") as f:
+            payload = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(payload, tuple) or len(payload) != 2:
+        return None
+    version, flow = payload
+    if version != _CACHE_VERSION or not isinstance(flow, TaskFlow):
+        return None
+    return flow
+
+
+def _write_flow_pickle(flow_path: str, flow: TaskFlow) -> None:
+    import os
+    import pickle
+    import tempfile
+
+    pkl = Path(flow_path).with_suffix(".flow.pkl")
+    try:
+        fd, tmp = tempfile.mkstemp(dir=str(pkl.parent), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((_CACHE_VERSION, flow), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, pkl)  # atomic — concurrent loaders see old or new, never partial
+    except OSError:
+        pass  # read-only flows dir — the in-process LRU still applies
+
+
+def _cache_clear() -> None:
+    _load_flow_cached.cache_clear()
+    _load_yaml_cached.cache_clear()
+    _index_flows.cache_clear()
+
+
+load_flow.cache_clear = _cache_clear  # type: ignore[attr-defined]
 
 
 def list_flows(flows_dir: str | Path | None = None) -> list[str]:
-    """List available task type names."""
-    flows_path = Path(flows_dir) if flows_dir else _DEFAULT_FLOWS_DIR
-    names = []
-    for p in sorted(flows_path.glob("*.yaml")):
-        name = p.stem
-        if name.startswith("_"):
-            name = name[1:]
-        names.append(name)
-    return names
+    """List available task type names. A missing flows dir lists as empty."""
+    flows_path = Path(flows_dir) if flows_dir else _find_flows_dir()
+    try:
+        mtime_ns = flows_path.stat().st_mtime_ns
+    except OSError:
+        return []
+    return sorted(_index_flows(str(flows_path), mtime_ns))
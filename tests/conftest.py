@@ -1,10 +1,85 @@
+import sqlite3
 from pathlib import Path
 
 import pytest
 
+from minion_tasks import TaskDB, list_flows, load_flow
+from minion_tasks.db import _SCHEMA_SQL, _dict_row
+
 FLOWS_DIR = Path(__file__).resolve().parent.parent / "task-flows"
 
 
 @pytest.fixture
 def flows_dir():
     return FLOWS_DIR
+
+
+def seed_task_at(db, task_id, target_status, agent):
+    """Walk a task down its flow's happy path to target_status.
+
+    Setup helper — one TaskDB session instead of a CLI invocation per hop."""
+    task = db.get_task(task_id)
+    flow = db._load_flow(task["task_type"])
+    status = task["status"]
+    while status != target_status:
+        status = flow.next_status(status)
+        if status is None:
+            raise ValueError(
+                f"No path from '{task['status']}' to '{target_status}' "
+                f"in flow '{task['task_type']}'"
+            )
+        db.transition_task(task_id, status, agent=agent)
+
+
+@pytest.fixture(scope="session")
+def loaded_flows():
+    """All flows built once per session — TaskFlow objects are immutable."""
+    return {name: load_flow(name, FLOWS_DIR) for name in list_flows(FLOWS_DIR)}
+
+
+@pytest.fixture
+def base_flow(loaded_flows):
+    return loaded_flows["base"]
+
+
+@pytest.fixture
+def bugfix_flow(loaded_flows):
+    return loaded_flows["bugfix"]
+
+
+@pytest.fixture
+def hotfix_flow(loaded_flows):
+    return loaded_flows["hotfix"]
+
+
+@pytest.fixture
+def build_flow(loaded_flows):
+    return loaded_flows["build"]
+
+
+@pytest.fixture(scope="session")
+def _schema_template():
+    """One :memory: connection with the schema applied, cloned per test."""
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(_SCHEMA_SQL)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def db(_schema_template):
+    """Fresh TaskDB on a :memory: clone of the schema template.
+
+    sqlite3's backup API copies pages in C, so per-test setup skips the
+    schema DDL; parsed flows are already shared via the loader's LRU cache.
+    Bypasses TaskDB.__init__, which would reconnect and re-run the DDL.
+    """
+    conn = sqlite3.connect(":memory:")
+    _schema_template.backup(conn)
+    conn.row_factory = _dict_row
+    conn.execute("PRAGMA foreign_keys=ON")
+    db = TaskDB.__new__(TaskDB)
+    db._conn = conn
+    db._flows_dir = FLOWS_DIR
+    yield db
+    conn.close()
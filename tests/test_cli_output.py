@@ -0,0 +1,220 @@
+"""CLI output tests using Click's CliRunner — JSON shape, compact format, error paths.
+
+Pure transition/filter logic is covered at the TaskDB layer in test_db.py;
+these tests only pay CliRunner's dispatch cost where the CLI itself is under test.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import uuid
+
+import pytest
+from click.testing import CliRunner
+from conftest import FLOWS_DIR, seed_task_at
+
+from minion_tasks.cli import main
+
+
+@pytest.fixture
+def seeded_task_db(seeded_db):
+    """Direct TaskDB handle on the seeded test DB, for in-process setup."""
+    from minion_tasks import TaskDB
+
+    db = TaskDB(seeded_db, flows_dir=FLOWS_DIR)
+    yield db
+    db.close()
+
+
+class _Runner(CliRunner):
+    """CliRunner without exception capture by default — passing tests skip the
+    capture plumbing, and unexpected errors surface as real tracebacks."""
+
+    def invoke(self, *args, **kwargs):
+        kwargs.setdefault("catch_exceptions", False)
+        return super().invoke(*args, **kwargs)
+
+
+@pytest.fixture
+def runner():
+    return _Runner()
+
+
+@pytest.fixture
+def db_env(monkeypatch):
+    """Point TaskDB at a unique shared-cache in-memory DB.
+
+    CLI invocations in the same process connect to it by URI, so tests do
+    no disk I/O at all; the anchor connection keeps the DB alive between
+    invocations."""
+    uri = f"file:mtask-test-{uuid.uuid4().hex}?mode=memory&cache=shared"
+    anchor = sqlite3.connect(uri, uri=True)
+    monkeypatch.setenv("MINION_TASKS_DB_PATH", uri)
+    yield uri
+    anchor.close()
+
+
+@pytest.fixture(scope="session")
+def _seed_template():
+    """Project + task seeded once per session via the TaskDB API directly.
+
+    SQLite savepoints can't roll back commits made on the CLI's own
+    connections, so shared state is cloned from this template instead."""
+    from minion_tasks import TaskDB
+
+    db = TaskDB(":memory:", flows_dir=FLOWS_DIR)
+    db.create_project("test-proj", "Test project")
+    db.create_task(
+        "BUG-001", "test-proj", "bugfix",
+        "loader crashes on circular inheritance", class_required="coder",
+    )
+    yield db._conn
+    db.close()
+
+
+@pytest.fixture
+def seeded_db(db_env, _seed_template):
+    """Per-test backup-API clone of the seeded template — no CLI invocations."""
+    dest = sqlite3.connect(db_env, uri=True)
+    _seed_template.backup(dest)
+    dest.close()
+    return db_env
+
+
+# --- Project round-trip ---
+
+
+def test_create_and_get_project(runner, db_env):
+    result = runner.invoke(main, ["create-project", "proj1", "-d", "My project"])
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert data["id"] == "proj1"
+    assert data["status"] == "active"
+
+    result = runner.invoke(main, ["get-project", "proj1"])
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert data["description"] == "My project"
+
+
+# --- Error paths ---
+
+
+def test_claim_task_not_open(runner, seeded_db, seeded_task_db):
+    seed_task_at(seeded_task_db, "BUG-001", "assigned", "fighter")
+    result = runner.invoke(main, ["claim-task", "BUG-001", "thief"])
+    assert result.exit_code == 1
+    assert "not 'open'" in result.output or "not 'open'" in (result.stderr or "")
+
+
+# --- complete output shape ---
+
+
+def test_complete_returns_routing(runner, seeded_db, seeded_task_db):
+    seed_task_at(seeded_task_db, "BUG-001", "in_progress", "fighter")
+    result = runner.invoke(main, ["complete", "BUG-001", "--agent", "fighter"])
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert data["to_status"] == "fixed"
+    assert isinstance(data["eligible_classes"], list)
+
+
+# --- transition ---
+
+
+def test_transition_invalid_warns_but_applies(runner, seeded_db):
+    # open → in_progress skips 'assigned' — warn on stderr, don't block
+    result = runner.invoke(
+        main, ["transition", "BUG-001", "in_progress", "--agent", "fighter"]
+    )
+    assert result.exit_code == 0
+    assert "valid=0" in result.stderr
+    data = json.loads(result.stdout)
+    assert data["status"] == "in_progress"
+    assert data["assigned_to"] == "fighter"
+
+
+# --- apply-transitions batch ---
+
+
+def test_apply_transitions_batch(runner, seeded_db):
+    batch = json.dumps([
+        {"task_id": "BUG-001", "to_status": "assigned", "agent": "fighter"},
+        {"task_id": "BUG-001", "to_status": "in_progress", "agent": "fighter"},
+    ])
+    result = runner.invoke(main, ["apply-transitions", "--batch-json", "-"], input=batch)
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert len(data) == 2
+    assert data[-1]["status"] == "in_progress"
+    assert data[-1]["assigned_to"] == "fighter"
+
+
+def test_apply_transitions_rejects_non_object_items(runner, seeded_db):
+    result = runner.invoke(main, ["apply-transitions", "--batch-json", "-"], input='["BUG-001"]')
+    assert result.exit_code == 1
+    assert "array of objects" in (result.stderr or result.output)
+
+
+def test_apply_transitions_warns_on_invalid(runner, seeded_db):
+    # open → in_progress skips 'assigned' — applied, but flagged on stderr
+    batch = json.dumps([{"task_id": "BUG-001", "to_status": "in_progress", "agent": "fighter"}])
+    result = runner.invoke(main, ["apply-transitions", "--batch-json", "-"], input=batch)
+    assert result.exit_code == 0
+    assert "valid=0" in result.stderr
+    data = json.loads(result.stdout)
+    assert data[0]["status"] == "in_progress"
+
+
+# --- Flow commands (no DB) ---
+
+
+def test_list_flows(runner):
+    result = runner.invoke(main, ["list-flows"])
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert "bugfix" in data
+    assert "hotfix" in data
+
+
+def test_show_flow_bugfix(runner):
+    result = runner.invoke(main, ["show-flow", "bugfix"])
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert data["name"] == "bugfix"
+    assert len(data["stages"]) > 0
+
+
+# --- Compact output ---
+
+
+def test_compact_list_tasks(runner, seeded_db):
+    result = runner.invoke(main, ["--compact", "list-tasks", "--class", "coder"])
+    assert result.exit_code == 0
+    assert "BUG-001" in result.output
+    assert "bugfix" in result.output
+    assert "coder" in result.output
+
+
+def test_compact_claim(runner, seeded_db):
+    result = runner.invoke(main, ["--compact", "claim-task", "BUG-001", "fighter"])
+    assert result.exit_code == 0
+    assert "BUG-001" in result.output
+    assert "assigned" in result.output
+    assert "fighter" in result.output
+
+
+def test_compact_complete(runner, seeded_db, seeded_task_db):
+    seed_task_at(seeded_task_db, "BUG-001", "in_progress", "fighter")
+    result = runner.invoke(main, ["--compact", "complete", "BUG-001", "--agent", "fighter"])
+    assert result.exit_code == 0
+    assert "fixed" in result.output
+
+
+def test_compact_transitions(runner, seeded_db, seeded_task_db):
+    seed_task_at(seeded_task_db, "BUG-001", "assigned", "fighter")
+    result = runner.invoke(main, ["--compact", "transitions", "BUG-001"])
+    assert result.exit_code == 0
+    assert "open → assigned" in result.output
+    assert "✓" in result.output
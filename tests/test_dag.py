@@ -2,90 +2,82 @@ from minion_tasks import load_flow
 from minion_tasks.dag import Transition
 
 
-def test_next_status_base(flows_dir):
-    flow = load_flow("base", flows_dir)
-    assert flow.next_status("in_progress", passed=True) == "fixed"
-    assert flow.next_status("fixed", passed=True) == "verified"
-    assert flow.next_status("fixed", passed=False) == "assigned"
-    assert flow.next_status("closed") is None
+def test_next_status_base(base_flow):
+    assert base_flow.next_status("in_progress", passed=True) == "fixed"
+    assert base_flow.next_status("fixed", passed=True) == "verified"
+    assert base_flow.next_status("fixed", passed=False) == "assigned"
+    assert base_flow.next_status("closed") is None
 
 
-def test_next_status_hotfix_skips(flows_dir):
-    flow = load_flow("hotfix", flows_dir)
+def test_next_status_hotfix_skips(hotfix_flow):
     # in_progress → fixed (skipped) → verified (skipped) → closed
-    assert flow.next_status("in_progress", passed=True) == "closed"
+    assert hotfix_flow.next_status("in_progress", passed=True) == "closed"
 
 
-def test_workers_for_fixed_coder(flows_dir):
+def test_next_status_via_load_flow(flows_dir):
+    """Same query through a direct load_flow call, for loader coverage."""
     flow = load_flow("base", flows_dir)
-    assert flow.workers_for("fixed", "coder") == ["oracle", "recon"]
+    assert flow.next_status("in_progress", passed=True) == "fixed"
 
 
-def test_workers_for_assigned_returns_none(flows_dir):
-    flow = load_flow("base", flows_dir)
-    assert flow.workers_for("assigned", "coder") is None
+def test_workers_for_fixed_coder(base_flow):
+    assert base_flow.workers_for("fixed", "coder") == ["oracle", "recon"]
 
 
-def test_workers_for_closed(flows_dir):
-    flow = load_flow("base", flows_dir)
-    assert flow.workers_for("closed", "coder") == ["lead"]
+def test_workers_for_assigned_returns_none(base_flow):
+    assert base_flow.workers_for("assigned", "coder") is None
 
 
-def test_valid_transitions_assigned(flows_dir):
-    flow = load_flow("base", flows_dir)
-    transitions = flow.valid_transitions("assigned")
+def test_workers_for_closed(base_flow):
+    assert base_flow.workers_for("closed", "coder") == ["lead"]
+
+
+def test_valid_transitions_assigned(base_flow):
+    transitions = base_flow.valid_transitions("assigned")
     assert transitions == {"in_progress", "abandoned", "stale", "obsolete"}
 
 
-def test_requires_fixed(flows_dir):
-    flow = load_flow("base", flows_dir)
+def test_requires_fixed(base_flow):
     # requires is on in_progress (before transitioning to fixed)
-    assert flow.requires("in_progress") == ["submit_result"]
-    assert flow.requires("assigned") == []
+    assert base_flow.requires("in_progress") == ["submit_result"]
+    assert base_flow.requires("assigned") == []
 
 
-def test_is_terminal(flows_dir):
-    flow = load_flow("base", flows_dir)
-    assert flow.is_terminal("closed") is True
-    assert flow.is_terminal("open") is False
-    assert flow.is_terminal("nonexistent") is False
+def test_is_terminal(base_flow):
+    assert base_flow.is_terminal("closed") is True
+    assert base_flow.is_terminal("open") is False
+    assert base_flow.is_terminal("nonexistent") is False
 
 
-def test_build_skips_fixed(flows_dir):
-    flow = load_flow("build", flows_dir)
-    assert flow.stages["fixed"].skip is True
+def test_build_skips_fixed(build_flow):
+    assert build_flow.stages["fixed"].skip is True
     # in_progress → (fixed skipped) → verified
-    assert flow.next_status("in_progress", passed=True) == "verified"
+    assert build_flow.next_status("in_progress", passed=True) == "verified"
 
 
-def test_hotfix_valid_transitions_in_progress(flows_dir):
+def test_hotfix_valid_transitions_in_progress(hotfix_flow):
     """Hotfix in_progress should show closed (after skip resolution), not fixed."""
-    flow = load_flow("hotfix", flows_dir)
-    transitions = flow.valid_transitions("in_progress")
+    transitions = hotfix_flow.valid_transitions("in_progress")
     assert "closed" in transitions
     assert "fixed" not in transitions
 
 
-def test_transition_bugfix_pass(flows_dir):
-    flow = load_flow("bugfix", flows_dir)
-    result = flow.transition("in_progress", "coder")
+def test_transition_bugfix_pass(bugfix_flow):
+    result = bugfix_flow.transition("in_progress", "coder")
     assert result == Transition(to_status="fixed", eligible_classes=["oracle", "recon"])
 
 
-def test_transition_bugfix_review_fail(flows_dir):
+def test_transition_bugfix_review_fail(bugfix_flow):
     """Review rejection at 'fixed' sends back to assigned (same agent continues)."""
-    flow = load_flow("bugfix", flows_dir)
-    result = flow.transition("fixed", "coder", passed=False)
+    result = bugfix_flow.transition("fixed", "coder", passed=False)
     assert result == Transition(to_status="assigned", eligible_classes=None)
 
 
-def test_transition_hotfix_skips_to_closed(flows_dir):
-    flow = load_flow("hotfix", flows_dir)
-    result = flow.transition("in_progress", "coder")
+def test_transition_hotfix_skips_to_closed(hotfix_flow):
+    result = hotfix_flow.transition("in_progress", "coder")
     assert result == Transition(to_status="closed", eligible_classes=["lead"])
 
 
-def test_transition_terminal_returns_none(flows_dir):
-    flow = load_flow("bugfix", flows_dir)
-    result = flow.transition("closed", "coder")
+def test_transition_terminal_returns_none(bugfix_flow):
+    result = bugfix_flow.transition("closed", "coder")
     assert result is None
@@ -1,17 +1,7 @@
-import warnings
-
 import pytest
 
-from minion_tasks import TaskDB
 from minion_tasks.dag import Transition
 
-FLOWS_DIR = pytest.importorskip("pathlib").Path(__file__).resolve().parent.parent / "task-flows"
-
-
-@pytest.fixture
-def db():
-    return TaskDB(":memory:", flows_dir=FLOWS_DIR)
-
 
 @pytest.fixture
 def db_with_task(db):
@@ -50,15 +40,23 @@ def test_transition_valid(db_with_task):
 
 def test_transition_invalid_logged(db_with_task):
     # open → in_progress is not a valid transition (must go through assigned)
-    with warnings.catch_warnings(record=True) as w:
-        warnings.simplefilter("always")
-        db_with_task.transition_task("BUG-1", "in_progress", agent="fighter")
-        assert len(w) == 1
-        assert "not valid" in str(w[0].message)
+    task, valid = db_with_task.transition_task("BUG-1", "in_progress", agent="fighter")
+    assert valid is False
     log = db_with_task.get_transitions("BUG-1")
     assert log[0]["valid"] == 0
     # Task still moved (warn, not block)
-    assert db_with_task.get_task("BUG-1")["status"] == "in_progress"
+    assert task["status"] == "in_progress"
+
+
+def test_transition_many_rolls_back_on_error(db_with_task):
+    with pytest.raises(ValueError, match="MISSING"):
+        db_with_task.transition_many([
+            {"task_id": "BUG-1", "to_status": "assigned", "agent": "fighter"},
+            {"task_id": "MISSING", "to_status": "assigned"},
+        ])
+    # First item rolled back with the rest — no partial application
+    assert db_with_task.get_task("BUG-1")["status"] == "open"
+    assert db_with_task.get_transitions("BUG-1") == []
 
 
 def test_complete_bugfix_pass(db_with_task):
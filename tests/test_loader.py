@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from minion_tasks import load_flow, list_flows
@@ -25,6 +27,13 @@ def test_load_nonexistent(flows_dir):
         load_flow("nonexistent", flows_dir)
 
 
+def test_missing_flows_dir(tmp_path):
+    missing = tmp_path / "no-such-dir"
+    assert list_flows(missing) == []
+    with pytest.raises(FileNotFoundError, match="not found"):
+        load_flow("bugfix", missing)
+
+
 def test_invalid_yaml_missing_next(tmp_path):
     bad_yaml = tmp_path / "broken.yaml"
     bad_yaml.write_text(
@@ -56,6 +65,53 @@ def test_inheritance_merges_stages(flows_dir):
     assert flow.dead_ends == ["abandoned", "stale", "obsolete"]
 
 
+def test_parent_edit_invalidates_child(tmp_path):
+    """Editing a parent flow rebuilds flows that inherit from it — the LRU
+    and pickle sidecar both key on the newest YAML mtime in the dir."""
+    parent = tmp_path / "_parent.yaml"
+    parent.write_text(
+        "name: parent\n"
+        "description: parent\n"
+        "stages:\n"
+        "  open:\n"
+        "    next: done\n"
+        "  done:\n"
+        "    next: null\n"
+    )
+    (tmp_path / "child.yaml").write_text(
+        "name: child\ndescription: child\ninherits: _parent\n"
+    )
+    assert load_flow("child", tmp_path).next_status("open") == "done"
+
+    parent.write_text(
+        "name: parent\n"
+        "description: parent\n"
+        "stages:\n"
+        "  open:\n"
+        "    next: reopened\n"
+        "  reopened:\n"
+        "    next: null\n"
+    )
+    # Force the mtime well past the sidecar written by the first load
+    st = parent.stat()
+    os.utime(parent, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+    assert load_flow("child", tmp_path).next_status("open") == "reopened"
+
+
+def test_unversioned_sidecar_is_cache_miss(tmp_path):
+    """A sidecar from an older package layout must reparse, not load — a
+    bare pickled flow lacking the version wrapper stands in for one."""
+    import pickle
+
+    (tmp_path / "solo.yaml").write_text(
+        "name: solo\ndescription: solo\nstages:\n  open:\n    next: null\n"
+    )
+    flow = load_flow("solo", tmp_path)
+    (tmp_path / "solo.flow.pkl").write_bytes(pickle.dumps(flow))
+    load_flow.cache_clear()
+    assert load_flow("solo", tmp_path).name == "solo"
+
+
 def test_research_overrides_workers(flows_dir):
     flow = load_flow("research", flows_dir)
     fixed = flow.stages["fixed"]